@@ -1,19 +1,33 @@
 #!/usr/bin/env python3
 import os
+import re
 import sys
+import platform
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from html.parser import HTMLParser
 import pandas as pd
 from fpdf import FPDF
-from bs4 import BeautifulSoup
 
 # Try to import Tk only if available (headless-safe).
+# Tk is skipped on PyPy, where tkinter is unreliable; pass --file there.
 try:
+    if platform.python_implementation() == "PyPy":
+        raise ImportError("tkinter is not used on PyPy")
     from tkinter import Tk, filedialog, TclError  # type: ignore
 except Exception:  # pragma: no cover
     Tk = None
     filedialog = None
     TclError = Exception
 
+# Prefer the Rust-backed calamine reader; otherwise let pandas pick (openpyxl/xlrd).
+try:
+    import python_calamine  # type: ignore  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:  # pragma: no cover
+    EXCEL_ENGINE = None
+
 # -------------- Text Safety & Rendering Helpers --------------
 
 def safe_cell(pdf, *args, **kwargs):
@@ -32,133 +46,215 @@ def safe_multi_cell(pdf, *args, **kwargs):
         print("Failed on multi_cell text:", args[0])
         raise e
 
+NON_BMP_RE = re.compile("[\U00010000-\U0010FFFF]")
+
+def safe_write(pdf, *args, **kwargs):
+    """Wrapper for pdf.write that reports failing content before raising."""
+    try:
+        pdf.write(*args, **kwargs)
+    except Exception as e:
+        print("Failed on write text:", args[1] if len(args) > 1 else args[0])
+        raise e
+
+def set_font_if_changed(pdf: FPDF, family: str, style: str = "", size: int = 10):
+    """Call pdf.set_font only when (family, style, size) differs from the last call."""
+    font = (family, style, size)
+    if getattr(pdf, "_last_font", None) == font:
+        return
+    pdf.set_font(family, style=style, size=size)
+    pdf._last_font = font
+
+def _is_missing(value: object) -> bool:
+    """Scalar stand-in for pd.isna: None, pd.NA or a float NaN."""
+    return value is None or value is pd.NA or (isinstance(value, float) and value != value)
+
 def clean_text(text: object) -> str:
     """
     Keep only BMP (U+0000..U+FFFF) to avoid surrogate/emoji issues in classic FPDF.
     Replace non-BMP with the replacement character and log them for visibility.
     """
-    if pd.isna(text):
+    if _is_missing(text):
         return "THERE IS NO TEXT!!!!"
     original = str(text)
-    removed = [c for c in original if ord(c) > 0xFFFF]
-    if removed:
-        print(f"⚠️ Removed/marked non-BMP characters: {removed}")
+    # Pure ASCII cannot contain non-BMP characters
+    if original.isascii():
+        return original
+    return _clean_str(original)
+
+@lru_cache(maxsize=8192)
+def _clean_str(original: str) -> str:
+    """Cached core of clean_text; names, teams and questions repeat across rows."""
+    removed = NON_BMP_RE.findall(original)
+    if not removed:
+        return original
+    print(f"⚠️ Removed/marked non-BMP characters: {removed}")
     # Replace non-BMP with the replacement char so readers see something was there.
-    filtered = ''.join(c if ord(c) <= 0xFFFF else "�" for c in original)
-    return filtered
-
-def render_list_item(pdf: FPDF, li, font_family: str, bullet="•", indent=0):
-    """Render a single <li>, supporting nested <ul>/<ol>."""
-    indent_str = "    " * indent
-    content = []
-
-    for child in li.contents:
-        if isinstance(child, str):
-            s = child.strip()
-            if s:
-                content.append(clean_text(s))
-        elif getattr(child, "name", None) in ["p", "span", None]:
-            txt = child.get_text(strip=True)
-            if txt:
-                content.append(clean_text(txt))
-        elif getattr(child, "name", None) in ["ul", "ol"]:
-            sub_bullet = "•" if child.name == "ul" else "1."
-            for j, sub_li in enumerate(child.find_all("li", recursive=False), 1):
-                render_list_item(
-                    pdf,
-                    sub_li,
-                    font_family=font_family,
-                    bullet=sub_bullet if child.name == "ul" else f"{j}.",
-                    indent=indent + 1
-                )
-            continue
-        else:
-            txt = child.get_text(strip=True)
-            if txt:
-                content.append(clean_text(txt))
+    return NON_BMP_RE.sub("�", original)
+
+# Inline tags and the style letter each one adds
+INLINE_STYLES = {"strong": "B", "b": "B", "em": "I", "i": "I", "u": "U"}
+# Inline tags that flow with the surrounding text without changing its style;
+# any tag not handled explicitly starts a new block
+PLAIN_INLINE_TAGS = {"a", "span", "s", "code", "sub", "sup", "mark", "small"}
 
-    full_line = f"{indent_str}{bullet} {' '.join(content).strip()}".rstrip()
-    if full_line:
-        pdf.set_font(font_family, size=10)
-        safe_multi_cell(pdf, 0, 6, full_line, align="L")
+TABLE_RE = re.compile(r"<table\b", re.IGNORECASE)
+
+def write_runs(pdf: FPDF, runs: list, font_family: str, prefix: str = "") -> bool:
+    """
+    Flow styled text runs as one block, switching fonts only between runs.
+    A non-empty prefix (list indent and bullet) is written first in the regular style.
+    Returns False if there was no visible text and nothing was written.
+    """
+    # Drop whitespace-only runs at the edges before cleaning the rest
+    start, end = 0, len(runs)
+    while start < end and not runs[start][0].strip():
+        start += 1
+    while end > start and not runs[end - 1][0].strip():
+        end -= 1
+    if start == end:
+        return False
+    runs = [(clean_text(text), style) for text, style in runs[start:end]]
+    runs[0] = (runs[0][0].lstrip(), runs[0][1])
+    runs[-1] = (runs[-1][0].rstrip(), runs[-1][1])
+
+    if prefix:
+        set_font_if_changed(pdf, font_family, size=10)
+        safe_write(pdf, 6, prefix)
+    for text, style in runs:
+        if text:
+            set_font_if_changed(pdf, font_family, style=style, size=10)
+            safe_write(pdf, 6, text)
+    pdf.ln(6)
+    return True
+
+class CommentRenderer(HTMLParser):
+    """
+    Stream a comment's HTML straight into the PDF, without building a tree.
+    Inline tags push styles; <p>, <li> and other block tags collect text runs
+    and flush them as one block; <ul>/<ol> track nesting depth and numbering.
+    """
+
+    def __init__(self, pdf: FPDF, font_family: str):
+        super().__init__(convert_charrefs=True)
+        self.pdf = pdf
+        self.font_family = font_family
+        self.styles = []  # (tag, style letter) for each open inline tag
+        self.style = ""   # combined style of self.styles, e.g. "BU"
+        self.runs = []    # (text, style) runs of the current block
+        self.lists = []   # per open list: [item counter for <ol> or None, len(self.items) at open]
+        self.items = []   # per open <li>: prefix for its next line
+
+    def restyle(self):
+        """Recompute the combined style; only called when an inline tag opens or closes."""
+        letters = "".join(letter for _, letter in self.styles)
+        self.style = "".join(c for c in "BIU" if c in letters)
+
+    def separate(self):
+        """Keep paragraphs inside a list item apart by a single space."""
+        if self.runs and not self.runs[-1][0][-1:].isspace():
+            self.runs.append((" ", self.style))
+
+    def boundary(self):
+        """End the current block: a new line outside list items, a space inside one."""
+        if self.items:
+            self.separate()
+        else:
+            self.flush()
+
+    def flush(self):
+        prefix = self.items[-1] if self.items else ""
+        if write_runs(self.pdf, self.runs, self.font_family, prefix=prefix) and self.items:
+            # Later lines of the same item (after a nested list) align under its text
+            self.items[-1] = " " * len(prefix)
+        self.runs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in INLINE_STYLES:
+            self.styles.append((tag, INLINE_STYLES[tag]))
+            self.restyle()
+        elif tag == "br":
+            self.runs.append(("\n", self.style))
+        elif tag == "p":
+            self.boundary()
+        elif tag in ["ul", "ol"]:
+            self.flush()
+            self.lists.append([0 if tag == "ol" else None, len(self.items)])
+        elif tag == "li":
+            self.flush()
+            # </li> is optional: a new item closes the previous one of the same list
+            del self.items[self.lists[-1][1] if self.lists else 0:]
+            if self.lists and self.lists[-1][0] is not None:
+                self.lists[-1][0] += 1
+                bullet = f"{self.lists[-1][0]}."
+            else:
+                bullet = "•"
+            indent = "    " * max(len(self.lists) - 1, 0)
+            self.items.append(f"{indent}{bullet} ")
+        elif tag not in PLAIN_INLINE_TAGS:
+            self.boundary()
+
+    def handle_endtag(self, tag):
+        if tag in INLINE_STYLES:
+            for i in range(len(self.styles) - 1, -1, -1):
+                if self.styles[i][0] == tag:
+                    del self.styles[i]
+                    self.restyle()
+                    break
+        elif tag == "p":
+            if self.items:
+                self.separate()
+            else:
+                self.flush()
+                self.pdf.ln(2)
+        elif tag in ["ul", "ol"]:
+            self.flush()
+            if self.lists:
+                # Also closes any items left open by an omitted </li>
+                del self.items[self.lists.pop()[1]:]
+        elif tag == "li":
+            self.flush()
+            # A stray </li> must not close an item of an enclosing list
+            if len(self.items) > (self.lists[-1][1] if self.lists else 0):
+                self.items.pop()
+        elif tag not in PLAIN_INLINE_TAGS and tag != "br":
+            self.boundary()
+
+    def handle_data(self, data):
+        # Whitespace before a block's first text would be trimmed anyway
+        if self.runs or not data.isspace():
+            self.runs.append((data, self.style))
+
+    def close(self):
+        super().close()
+        self.flush()
 
 def render_html_comment(pdf: FPDF, html_content, font_family: str):
     """
     Render a small subset of HTML into the PDF:
-    - p, strong/b, em/i, u, ul/ol/li
+    - p, strong/b, em/i, u, br, ul/ol/li
     - Tables are rejected (unsupported).
     """
-    if pd.isna(html_content) or not str(html_content).strip():
-        pdf.set_font(font_family, style="I", size=10)
+    if _is_missing(html_content) or not str(html_content).strip():
+        set_font_if_changed(pdf, font_family, style="I", size=10)
         safe_multi_cell(pdf, 0, 6, "No comment provided.", align="L")
         return
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    html_content = str(html_content)
+
+    # Plain text (no tags or entities) needs no parsing at all
+    if "<" not in html_content and "&" not in html_content:
+        set_font_if_changed(pdf, font_family, size=10)
+        safe_multi_cell(pdf, 0, 6, clean_text(html_content.strip()), align="L")
+        return
 
-    if soup.find("table"):
+    # Checked up front so nothing of a rejected comment reaches the page
+    if TABLE_RE.search(html_content):
         print("Error: HTML contains a table. PDF generation for tables is not supported.")
         return
 
-    def render_tag(tag):
-        # Text node
-        if getattr(tag, "name", None) is None:
-            txt = clean_text(tag)
-            if txt.strip():
-                pdf.set_font(font_family, size=10)
-                safe_multi_cell(pdf, 0, 6, txt, align="L")
-            return
-
-        # Paragraph
-        if tag.name == "p":
-            for inner in tag.children:
-                render_tag(inner)
-            pdf.ln(2)
-            return
-
-        # Strong/Bold
-        if tag.name in ["strong", "b"]:
-            txt = clean_text(tag.get_text())
-            if txt.strip():
-                pdf.set_font(font_family, style="B", size=10)
-                safe_multi_cell(pdf, 0, 6, txt, align="L")
-            return
-
-        # Emphasis/Italic
-        if tag.name in ["em", "i"]:
-            txt = clean_text(tag.get_text())
-            if txt.strip():
-                pdf.set_font(font_family, style="I", size=10)
-                safe_multi_cell(pdf, 0, 6, txt, align="L")
-            return
-
-        # Underline (real underline)
-        if tag.name == "u":
-            txt = clean_text(tag.get_text())
-            if txt.strip():
-                pdf.set_font(font_family, style="U", size=10)
-                safe_multi_cell(pdf, 0, 6, txt, align="L")
-            return
-
-        # Unordered list
-        if tag.name == "ul":
-            for li in tag.find_all("li", recursive=False):
-                render_list_item(pdf, li, font_family=font_family, bullet="•", indent=0)
-            return
-
-        # Ordered list
-        if tag.name == "ol":
-            for i, li in enumerate(tag.find_all("li", recursive=False), 1):
-                render_list_item(pdf, li, font_family=font_family, bullet=f"{i}.", indent=0)
-            return
-
-        # Fallback: dump text
-        txt = clean_text(tag.get_text())
-        if txt.strip():
-            pdf.set_font(font_family, size=10)
-            safe_multi_cell(pdf, 0, 6, txt, align="L")
-
-    for child in soup.children:
-        render_tag(child)
+    renderer = CommentRenderer(pdf, font_family)
+    renderer.feed(html_content)
+    renderer.close()
 
 # -------------- Font Handling --------------
 
@@ -216,20 +312,57 @@ def ensure_fonts(base_fonts_dir: str, preset_key: str) -> tuple[str, dict]:
 
     return family_name, paths
 
+# Font registrations parsed once per run, keyed by (family, regular font path)
+_FONT_CACHE = {}
+
 def add_fonts(pdf: FPDF, family_name: str, fonts: dict):
-    """Register fonts with FPDF for Unicode output."""
-    pdf.add_font(family_name, "", fonts["regular"], uni=True)
-    pdf.add_font(family_name, "B", fonts["bold"], uni=True)
-    pdf.add_font(family_name, "I", fonts["italic"], uni=True)
-    pdf.add_font(family_name, "BI", fonts["bold_italic"], uni=True)
+    """
+    Register fonts with FPDF for Unicode output.
+    The TTF metrics are loaded on the first call only; later documents get
+    fresh copies of the cached entries (subsets and object numbers are per-PDF).
+    """
+    key = (family_name, fonts["regular"])
+    if key not in _FONT_CACHE:
+        template = FPDF()
+        template.add_font(family_name, "", fonts["regular"], uni=True)
+        template.add_font(family_name, "B", fonts["bold"], uni=True)
+        template.add_font(family_name, "I", fonts["italic"], uni=True)
+        template.add_font(family_name, "BI", fonts["bold_italic"], uni=True)
+        _FONT_CACHE[key] = (template.fonts, template.font_files)
+
+    cached_fonts, cached_files = _FONT_CACHE[key]
+    for fontkey, font in cached_fonts.items():
+        if fontkey in pdf.fonts:
+            continue
+        pdf.fonts[fontkey] = dict(font, i=len(pdf.fonts) + 1, subset=list(font["subset"]))
+    for name, info in cached_files.items():
+        pdf.font_files.setdefault(name, dict(info))
 
 # -------------- Core Generation Logic --------------
 
-def detect_reviewer_column(df: pd.DataFrame) -> str:
+# Text columns read from the export (both reviewer column spellings are listed)
+TEXT_COLUMNS = [
+    "Reviewee name", "Review Cycle name", "Team - Reviewee", "Position - Reviewee",
+    "Reviewer's name", "Reviewers name",
+    "Feedback type", "Question", "Question description", "Response comment",
+]
+READ_COLUMNS = frozenset(TEXT_COLUMNS + ["Review cycle launch date"])
+
+# Per-row columns rendered in each section
+ROW_COLUMNS = ["Review cycle launch date", "Question", "Question description", "Response comment"]
+
+def format_dates(values: pd.Series) -> pd.Series:
+    """Format dates as YYYY-MM-DD in one pass; unparseable values keep their raw text."""
+    # format="mixed" parses each value on its own, like the old per-row to_datetime,
+    # instead of inferring one format from the first value and coercing the rest.
+    parsed = pd.to_datetime(values, errors="coerce", format="mixed").dt.strftime('%Y-%m-%d')
+    return parsed.fillna(values.map(str))
+
+def detect_reviewer_column(columns: set) -> str:
     """Detect the reviewer name column with a couple of common variants."""
-    if "Reviewer's name" in df.columns:
+    if "Reviewer's name" in columns:
         return "Reviewer's name"
-    if "Reviewers name" in df.columns:
+    if "Reviewers name" in columns:
         return "Reviewers name"
     raise KeyError("Reviewer name column not found (expected one of: \"Reviewer's name\", \"Reviewers name\").")
 
@@ -251,6 +384,82 @@ def choose_file_interactively() -> str:
         # Headless or display error
         return ""
 
+def render_one_pdf(job) -> tuple[str, bytes]:
+    """
+    Render the PDF for one group in memory, returning (filepath, bytes).
+    Takes a plain tuple so it can be pickled to a worker process:
+    (group_key, [(header, rows DataFrame), ...], font_family, fonts, filepath)
+    """
+    group_key, group_sections, font_family, fonts, filepath = job
+    reviewee, review_cycle, reviewee_team, reviewee_position, reviewer = group_key
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=15)
+    pdf.add_page()
+
+    add_fonts(pdf, font_family, fonts)
+
+    # Title block
+    set_font_if_changed(pdf, font_family, style="B", size=16)
+    safe_cell(pdf, 200, 10, clean_text(f"{reviewee} - {review_cycle}"), ln=True, align="C")
+    set_font_if_changed(pdf, font_family, size=10)
+    safe_cell(pdf, 0, 5, clean_text(f"Team: {reviewee_team}"), ln=True, align="C")
+    safe_cell(pdf, 0, 5, clean_text(f"Position: {reviewee_position}"), ln=True, align="C")
+    set_font_if_changed(pdf, font_family, style="BI", size=10)
+    pdf.ln(10)
+
+    # Sections
+    for header, feedback_data in group_sections:
+        set_font_if_changed(pdf, font_family, size=14)
+        safe_cell(pdf, 200, 10, clean_text(header), ln=True)
+        pdf.ln(5)
+
+        # One plain array per column; rows are walked by position across them
+        dates = format_dates(feedback_data["Review cycle launch date"]).to_numpy()
+        questions = feedback_data["Question"].to_numpy()
+        descriptions = feedback_data["Question description"].to_numpy()
+        comments = feedback_data["Response comment"].to_numpy()
+
+        for date_str, question, description, comment in zip(dates, questions, descriptions, comments):
+            # Date / reviewer
+            set_font_if_changed(pdf, font_family, size=8)
+            safe_multi_cell(pdf, 0, 8, clean_text(f"Date: {date_str} / Reviewer: {reviewer}"), align="L")
+
+            # Question
+            set_font_if_changed(pdf, font_family, style="B", size=12)
+            safe_multi_cell(pdf, 0, 7, clean_text(f"Question: {question}"), align="L")
+
+            # Description
+            set_font_if_changed(pdf, font_family, style="B", size=10)
+            safe_multi_cell(pdf, 0, 6, clean_text(f"{description}"), align="L")
+
+            # Comment (HTML)
+            set_font_if_changed(pdf, font_family, style="B", size=10)
+            safe_cell(pdf, 0, 6, "Response:", ln=True)
+            render_html_comment(pdf, comment, font_family=font_family)
+            pdf.ln(5)
+
+    try:
+        # Classic FPDF returns the document as a latin-1 str
+        data = pdf.output(dest="S").encode("latin-1")
+    except Exception as e:
+        print("\nError during pdf.output")
+        print(f"Failed to render: {filepath}")
+        raise e
+
+    return filepath, data
+
+def write_pdf(filepath: str, data: bytes):
+    """Write a rendered PDF to disk; runs on the writer thread."""
+    try:
+        with open(filepath, "wb") as f:
+            f.write(data)
+    except Exception as e:
+        print("\nError while writing PDF")
+        print(f"Failed to write: {filepath}")
+        raise e
+
+    print(f"Generated: {filepath}")
+
 def generate_pdfs(xlsx_path: str, font_preset: str = "noto"):
     if not xlsx_path:
         print("No file selected. Exiting...")
@@ -261,8 +470,16 @@ def generate_pdfs(xlsx_path: str, font_preset: str = "noto"):
     output_dir = os.path.join(os.path.dirname(xlsx_path), "generated_pdfs")
     os.makedirs(output_dir, exist_ok=True)
 
-    xls = pd.ExcelFile(xlsx_path)
-    df = pd.read_excel(xls, sheet_name=xls.sheet_names[0])
+    # Only parse the columns we render; text columns are read as str up front
+    df = pd.read_excel(
+        xlsx_path,
+        sheet_name=0,
+        usecols=lambda c: c in READ_COLUMNS,
+        dtype={c: str for c in TEXT_COLUMNS},
+        engine=EXCEL_ENGINE,
+    )
+
+    cols = set(df.columns)
 
     # Map internal feedback types to display headers
     feedback_type_mapping = {
@@ -270,88 +487,77 @@ def generate_pdfs(xlsx_path: str, font_preset: str = "noto"):
         "auto_shared_feedback": "Supervisor Review",
         "shared_feedback": "Supervisor Review"
     }
+    section_order = list(dict.fromkeys(feedback_type_mapping.values()))
 
     # Grouping columns
     try:
-        reviewer_col = detect_reviewer_column(df)
+        reviewer_col = detect_reviewer_column(cols)
     except KeyError as e:
         print(f"Error: {e}")
         sys.exit(1)
 
     group_columns = ["Reviewee name", "Review Cycle name", "Team - Reviewee", "Position - Reviewee", reviewer_col]
-    missing = [c for c in group_columns if c not in df.columns]
+    missing = [c for c in group_columns if c not in cols]
     if missing:
         print(f"Error: Missing expected columns: {missing}")
         sys.exit(1)
 
-    grouped = df.groupby(group_columns)
+    # Older exports may lack the launch date; render it as empty like before
+    if "Review cycle launch date" not in cols:
+        df["Review cycle launch date"] = ""
+
+    # Attach the display header once; unmapped feedback types get NaN and no section
+    df["__section"] = df["Feedback type"].map(feedback_type_mapping)
+
+    grouped = df.groupby(group_columns, sort=False)
+    # Split each group by section in the same pass, keyed by (*group key, header)
+    sections = {key: frame for key, frame in df.groupby(group_columns + ["__section"], sort=False)}
 
     # Fonts
     script_dir = os.path.dirname(os.path.abspath(__file__))
     base_fonts_dir = os.path.join(script_dir, "fonts")
     font_family, fonts = ensure_fonts(base_fonts_dir, font_preset)
 
-    # Generate one PDF per group
-    for (reviewee, review_cycle, reviewee_team, reviewee_position, reviewer), group in grouped:
-        pdf = FPDF()
-        pdf.set_auto_page_break(auto=True, margin=15)
-        pdf.add_page()
-
-        add_fonts(pdf, font_family, fonts)
-
-        # Title block
-        pdf.set_font(font_family, style="B", size=16)
-        safe_cell(pdf, 200, 10, clean_text(f"{reviewee} - {review_cycle}"), ln=True, align="C")
-        pdf.set_font(font_family, size=10)
-        safe_cell(pdf, 0, 5, clean_text(f"Team: {reviewee_team}"), ln=True, align="C")
-        safe_cell(pdf, 0, 5, clean_text(f"Position: {reviewee_position}"), ln=True, align="C")
-        pdf.set_font(font_family, style="BI", size=10)
-        pdf.ln(10)
-
-        # Sections
-        for feedback_type, header in feedback_type_mapping.items():
-            feedback_data = group[group["Feedback type"] == feedback_type]
-
-            if not feedback_data.empty:
-                pdf.set_font(font_family, size=14)
-                safe_cell(pdf, 200, 10, clean_text(header), ln=True)
-                pdf.ln(5)
-
-                for _, row in feedback_data.iterrows():
-                    # Date / reviewer
-                    pdf.set_font(font_family, size=8)
-                    try:
-                        date_str = pd.to_datetime(row['Review cycle launch date']).strftime('%Y-%m-%d')
-                    except Exception:
-                        date_str = clean_text(str(row.get('Review cycle launch date', '')))
-                    safe_multi_cell(pdf, 0, 8, clean_text(f"Date: {date_str} / Reviewer: {reviewer}"), align="L")
-
-                    # Question
-                    pdf.set_font(font_family, style="B", size=12)
-                    safe_multi_cell(pdf, 0, 7, clean_text(f"Question: {row['Question']}"), align="L")
-
-                    # Description
-                    pdf.set_font(font_family, style="B", size=10)
-                    safe_multi_cell(pdf, 0, 6, clean_text(f"{row['Question description']}"), align="L")
-
-                    # Comment (HTML)
-                    pdf.set_font(font_family, style="B", size=10)
-                    safe_cell(pdf, 0, 6, "Response:", ln=True)
-                    render_html_comment(pdf, row['Response comment'], font_family=font_family)
-                    pdf.ln(5)
-
-        sanitized_name = str(reviewee).replace(" ", "_")
-        filename = f"{sanitized_name}_{review_cycle}.pdf"
-        filepath = os.path.join(output_dir, filename)
-
-        try:
-            pdf.output(filepath)
-        except Exception as e:
-            print("\nError during pdf.output")
-            print(f"Failed to write: {filepath}")
-            raise e
-
-        print(f"Generated: {filepath}")
+    # Output paths for all groups at once: <Reviewee_name>_<Review Cycle name>.pdf
+    # Sorted like baseline's sorted groupby, so when groups share a file name the
+    # same group (the sorted-last one) is written last
+    group_keys = sorted(grouped.groups.keys())
+    keys_df = pd.DataFrame(group_keys, columns=group_columns)
+    filepaths = (
+        os.path.join(output_dir, "")
+        + keys_df["Reviewee name"].astype(str).str.replace(" ", "_", regex=False)
+        + "_" + keys_df["Review Cycle name"].astype(str) + ".pdf"
+    ).tolist()
+
+    # One job per PDF; sections are (header, rows) in display order
+    jobs = []
+    for group_key, filepath in zip(group_keys, filepaths):
+        group_sections = []
+        for header in section_order:
+            feedback_data = sections.get(group_key + (header,))
+            if feedback_data is not None:
+                group_sections.append((header, feedback_data[ROW_COLUMNS]))
+        jobs.append((group_key, group_sections, font_family, fonts, filepath))
+
+    # Groups are independent, so large exports are spread over worker processes.
+    # Starting workers costs more than it saves on small exports (on spawn
+    # platforms each worker re-imports pandas), so those stay serial. Disk writes
+    # go to a writer thread so they overlap with rendering the next PDFs. A single
+    # writer keeps them in sorted group-key order: groups that map to the same file
+    # name (same reviewee and cycle) overwrite each other, and the sorted-last wins.
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=1) as writer:
+        writes = []
+        if workers > 1 and len(jobs) > workers * 4:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                for filepath, data in pool.map(render_one_pdf, jobs, chunksize=chunksize):
+                    writes.append(writer.submit(write_pdf, filepath, data))
+        else:
+            for job in jobs:
+                writes.append(writer.submit(write_pdf, *render_one_pdf(job)))
+        for write in writes:
+            write.result()
 
     print(f"\nAll PDFs have been created in: '{output_dir}'")
 